@@ -1,10 +1,12 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import asyncio
 import json
+import orjson
+import msgspec
 import numpy as np
 import websockets
 import os
@@ -14,19 +16,21 @@ import uuid
 import aiohttp
 import time
 from dataclasses import dataclass
-from typing import Optional, List, Deque
-from collections import deque
-import logging
+from typing import Optional, List, Dict
+from collections import OrderedDict, deque
 import io
+import array
+import logging
+import weakref
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
 load_dotenv()
 
+# Configure logging - per-frame diagnostics are DEBUG, set LOG_LEVEL to see more
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
+
 # Create necessary directories
 os.makedirs("questions", exist_ok=True)
 os.makedirs("transcripts", exist_ok=True)
@@ -34,7 +38,7 @@ os.makedirs("static/css", exist_ok=True)
 os.makedirs("static/js", exist_ok=True)
 os.makedirs("templates", exist_ok=True)
 
-app = FastAPI(title="Interview Bot API")
+app = FastAPI(title="Interview Bot API", default_response_class=ORJSONResponse)
 
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -48,38 +52,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@dataclass
-class AudioBuffer:
+class TranscriptMsg(msgspec.Struct, tag="transcript", tag_field="type", array_like=True):
     """
-    Buffer for audio data to optimize network transmission.
-    Helps in batching audio chunks for efficient sending.
+    Compact transcript update sent to the client.
+    Encoded positionally as ["transcript", transcript, is_final, live, full_answer];
+    full_answer is only filled in for final results.
     """
-    max_size: int = 6
-    buffer: Deque[bytes] = None
-    
-    def __post_init__(self):
-        if self.buffer is None:
-            self.buffer = deque(maxlen=self.max_size)
-    
-    def add_chunk(self, audio_data: bytes):
-        """Add audio chunk to buffer"""
-        self.buffer.append(audio_data)
-    
-    def get_buffered_data(self) -> bytes:
-        """Get all buffered data and clear buffer"""
-        if not self.buffer:
-            return b''
-        combined = b''.join(self.buffer)
-        self.buffer.clear()
-        return combined
-    
-    def should_send(self) -> bool:
-        """Check if buffer has enough data to send"""
-        return len(self.buffer) >= self.max_size
-    
-    def has_data(self) -> bool:
-        """Check if buffer has any data"""
-        return len(self.buffer) > 0
+    transcript: str
+    is_final: bool
+    live: str
+    full_answer: Optional[str] = None
+
+# Deepgram frame types that need no handling - matched on the raw message before parsing
+DEEPGRAM_IGNORED_FRAMES = ('"type":"Metadata"', '"type":"SpeechStarted"', '"type":"UtteranceEnd"')
+DEEPGRAM_RESULTS_FRAME = '"type":"Results"'
+
+# Static instructions for the Groq completion check, sent as the system message
+COMPLETION_SYSTEM_PROMPT = """You are analyzing a live Python technical interview. Determine if the candidate's answer is COMPLETE and we should move to next question.
+
+You will receive the QUESTION, the FULL ANSWER (everything said so far) and the CURRENT/LATEST TRANSCRIPT (what they just said).
+
+DECISION CRITERIA:
+- If the FULL ANSWER shows BASIC UNDERSTANDING with at least 1 valid point about the core concept, respond: COMPLETE
+- If the FULL ANSWER is factually correct and relevant (even if brief), respond: COMPLETE
+
+- If CURRENT TRANSCRIPT shows the candidate is clearly MID-SENTENCE or says "um", "uh", "and", "so" indicating they want to continue, respond: WAIT
+- If CURRENT TRANSCRIPT is empty or very short but FULL ANSWER is substantial and complete, respond: COMPLETE
+- If both FULL ANSWER and CURRENT TRANSCRIPT suggest the candidate has finished their thought, respond: COMPLETE
+- Only respond WAIT if the candidate is clearly still speaking or the CURRENT TRANSCRIPT indicates they want to add more
+- Even if the current_transcript and full_answer is irrelevent to the question, respond : WAIT
+
+CONTEXT ANALYSIS:
+- Look at FULL ANSWER to see if the core question has been addressed
+- Look at CURRENT TRANSCRIPT to see if they're still actively speaking
+- Consider if the answer ends naturally or seems cut off
+
+Respond with ONLY one word: either "COMPLETE" or "WAIT" (no explanation)"""
+
+# Groq request timeout bounds - a 70B completion needs a few seconds even on a fast day
+GROQ_TIMEOUT_MIN = 3.0
+GROQ_TIMEOUT_INITIAL = 8.0
+GROQ_TIMEOUT_MAX = 20.0  # Ceiling once timeouts have backed the RTO off
+
+# TTS audio cache shared by all sessions - questions come from a small fixed list
+TTS_CACHE: Dict[str, bytes] = {}
+TTS_LOCKS: Dict[str, asyncio.Lock] = {}
+
+async def send_json_fast(ws, obj):
+    """Send a JSON message as a binary frame encoded with orjson instead of stdlib json"""
+    await ws.send_bytes(orjson.dumps(obj))
 
 @dataclass
 class ThrottledChecker:
@@ -92,11 +113,15 @@ class ThrottledChecker:
     
     async def should_check(self) -> bool:
         """Check if enough time has passed since last AI check"""
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_check >= self.min_interval:
             self.last_check = now
             return True
         return False
+    
+    def time_until_next(self) -> float:
+        """Seconds remaining until the next AI check is allowed"""
+        return max(0.0, self.last_check + self.min_interval - time.monotonic())
 
 @dataclass
 class AdaptiveTimer:
@@ -123,26 +148,51 @@ class ConnectionHealthMonitor:
     Monitors WebSocket connection health and audio transmission status
     to detect and handle connection issues.
     """
+    HISTORY_SIZE = 10
+    
     def __init__(self):
-        self.last_pong = time.time()
-        self.latency_history = deque(maxlen=10)
-        self.last_audio_received = time.time()
+        self.last_pong = time.monotonic()
+        # Fixed ring of recent Deepgram ping round-trip times (seconds) - no per-sample objects
+        self._lat = array.array('d', [0.0] * self.HISTORY_SIZE)
+        self._lat_i = 0
+        self._lat_count = 0
+        self.last_audio_received = time.monotonic()
     
-    def update_pong(self):
-        """Update last pong time for connection health monitoring"""
-        self.last_pong = time.time()
+    def track_ping(self, pong_waiter: asyncio.Future):
+        """Record the round-trip time of a websocket ping once its pong arrives"""
+        sent = time.monotonic()
+        
+        def on_pong(fut: asyncio.Future):
+            if not fut.cancelled() and fut.exception() is None:
+                self.update_pong(time.monotonic() - sent)
+        
+        pong_waiter.add_done_callback(on_pong)
+    
+    def update_pong(self, rtt: float):
+        """Update last pong time and latency history for connection health monitoring"""
+        self.last_pong = time.monotonic()
+        self._lat[self._lat_i] = rtt
+        self._lat_i = (self._lat_i + 1) % self.HISTORY_SIZE
+        self._lat_count = min(self._lat_count + 1, self.HISTORY_SIZE)
+    
+    def average_latency(self) -> Optional[float]:
+        """Mean of the recent ping round-trip times, or None before the first pong"""
+        if not self._lat_count:
+            return None
+        return sum(self._lat[:self._lat_count]) / self._lat_count
     
     def update_audio_received(self):
         """Update last audio received time for activity monitoring"""
-        self.last_audio_received = time.time()
+        self.last_audio_received = time.monotonic()
     
     def get_health_score(self) -> float:
         """
         Calculate connection health score based on recent activity.
         Returns score between 0.0 (poor) and 1.0 (excellent)
         """
-        time_since_audio = time.time() - self.last_audio_received
-        time_since_pong = time.time() - self.last_pong
+        now = time.monotonic()
+        time_since_audio = now - self.last_audio_received
+        time_since_pong = now - self.last_pong
         
         if time_since_audio > 5.0:
             return 0.0
@@ -155,14 +205,25 @@ class ConnectionHealthMonitor:
 class TranscriptManager:
     """
     Manages interview transcripts - saving to file and organizing by session.
+    Answers are kept in memory and appended to a JSONL journal every
+    flush_every questions; finalize() compacts everything into the indented
+    JSON transcript at session end.
     """
-    def __init__(self, interview_id: str):
+    def __init__(self, interview_id: str, flush_every: int = 3):
         self.interview_id = interview_id
+        self.created_at = datetime.now().isoformat()
         # Store transcripts in transcripts folder
-        self.transcript_filename = f"transcripts/interview_transcript_{self.interview_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        base_filename = f"transcripts/interview_transcript_{self.interview_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.transcript_filename = f"{base_filename}.json"
+        self.journal_filename = f"{base_filename}.jsonl"
         self.transcripts = []
+        self.flush_every = flush_every  # Questions buffered before hitting the disk
+        self.dirty = 0  # Answers not yet written to the journal
+        self._journal_started = False
+        # Serializes journal appends and finalize so a late append cannot recreate the journal
+        self._write_lock = asyncio.Lock()
         
-    def add_transcript(self, question: str, answer_segments: list, question_number: int):
+    async def add_transcript(self, question: str, answer_segments: list, question_number: int):
         """
         Add a completed question-answer pair to transcripts
         """
@@ -176,26 +237,108 @@ class TranscriptManager:
         }
         
         self.transcripts.append(transcript_data)
-        self._save_transcript()
+        self.dirty += 1
+        if self.dirty >= self.flush_every:
+            await self.flush()
         return transcript_data
     
-    def _save_transcript(self):
-        """Save transcript to JSON file"""
+    async def flush(self):
+        """Append all unsaved transcript entries to the JSONL journal off the event loop"""
+        async with self._write_lock:
+            if not self.dirty:
+                return
+            pending = self.transcripts[-self.dirty:]
+            self.dirty = 0
+            await asyncio.get_running_loop().run_in_executor(None, self._save_transcript_sync, pending)
+    
+    def _save_transcript_sync(self, pending: list):
+        """Append transcript lines in one write, writing the interview header first if needed"""
+        try:
+            lines = b''
+            if not self._journal_started:
+                # First journal line is the interview header
+                lines += orjson.dumps({
+                    "interview_id": self.interview_id,
+                    "created_at": self.created_at
+                }) + b'\n'
+            for transcript_data in pending:
+                lines += orjson.dumps(transcript_data, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+            
+            with open(self.journal_filename, 'ab') as f:
+                f.write(lines)
+            self._journal_started = True
+            
+            logger.info(f"Transcript saved: {self.journal_filename} ({len(pending)} answers)")
+            
+        except Exception as e:
+            logger.error(f"Error saving transcript: {e}")
+    
+    async def finalize(self):
+        """
+        Compact the journal into the indented JSON transcript file.
+        Safe to call more than once; no JSON file is written if no answers were recorded.
+        """
+        async with self._write_lock:
+            self.dirty = 0  # The full JSON below covers any unflushed answers
+            await asyncio.get_running_loop().run_in_executor(None, self._finalize_sync)
+    
+    def _finalize_sync(self):
+        """Atomically write the indented JSON transcript and remove the journal"""
+        if not self.transcripts:
+            return
+        
         try:
             data = {
                 "interview_id": self.interview_id,
-                "created_at": datetime.now().isoformat(),
+                "created_at": self.created_at,
                 "total_questions": len(self.transcripts),
                 "transcripts": self.transcripts
             }
             
-            with open(self.transcript_filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename so readers never see a partial transcript
+            tmp_filename = f"{self.transcript_filename}.tmp"
+            with open(tmp_filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_filename, self.transcript_filename)
+            
+            if os.path.exists(self.journal_filename):
+                os.remove(self.journal_filename)
+            self._journal_started = False
             
-            logger.info(f"Transcript saved: {self.transcript_filename}")
+            logger.info(f"Transcript finalized: {self.transcript_filename}")
             
         except Exception as e:
-            logger.error(f"Error saving transcript: {e}")
+            logger.error(f"Error finalizing transcript: {e}")
+
+def load_questions():
+    """
+    Load questions from JSON file in questions folder.
+    Falls back to default questions if file not found.
+    """
+    try:
+        with open('questions/questions.json', 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+        logger.info(f"Loaded {len(questions)} questions from file")
+        return questions
+    except FileNotFoundError:
+        logger.warning("Questions file not found, using default questions")
+        return [
+            "What is the difference between a list and a tuple in Python?",
+            "Explain how Python's garbage collection works.",
+            "What are decorators in Python and how do you use them?",
+            "How does Python handle memory management?",
+            "What are Python generators and when would you use them?",
+        ]
+    except Exception as e:
+        logger.error(f"Error loading questions: {e}, using default questions")
+        return [
+            "What is the difference between a list and a tuple in Python?",
+            "Explain how Python's garbage collection works.",
+            "What are decorators in Python and how do you use them?",
+        ]
+
+# Questions are loaded once at import and shared read-only by every session
+QUESTIONS: tuple = tuple(load_questions())
 
 class InterviewSession:
     """
@@ -205,16 +348,29 @@ class InterviewSession:
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.deepgram_ws = None
-        self.questions = self._load_questions()
+        self.questions = QUESTIONS
         self.current_question_index = 0
-        self.transcript_buffer = []
+        self.transcript_buffer = deque()
+        # Answer text built incrementally as segments arrive, plus running totals
+        self.transcript_committed = io.StringIO()
+        self.transcript_word_count = 0
+        self.transcript_dirty = False
+        self._full_answer_cache = ""
+        self._transcript_fingerprint = hash("")
         self.live_transcript = ""
-        self.last_speech_time = time.time()
         self.is_listening = False
         self.is_playing_question = False
         self.current_question = ""
         self.websocket = None  # Store websocket reference
         
+        # Outgoing transcript updates, coalesced by flush_out_loop
+        self.out_queue: asyncio.Queue = asyncio.Queue()
+        self.pending_interim: Optional[TranscriptMsg] = None
+        self.out_event = asyncio.Event()  # Set when out_queue or pending_interim has something to send
+        # Set whenever new speech arrives or listening starts - wakes the auto-check loop
+        self.speech_event = asyncio.Event()
+        self.msg_encoder = msgspec.json.Encoder()
+        
         # Smart pause detection settings
         self.silence_threshold = 0.01
         self.initial_pause_duration = 2.0
@@ -224,49 +380,35 @@ class InterviewSession:
         self.absolute_silence_limit = 15.0
         self.current_pause_duration = self.initial_pause_duration
         self.consecutive_wait_count = 0
-        self.answer_start_time = time.time()
+        self.mark_answer_start()
         self.has_meaningful_speech = False
-        self.last_transcript_length = 0
-        self.last_transcript_check_time = time.time()
+        self.last_transcript_fp = hash("")
+        self.last_transcript_check_time = time.monotonic()
         
         # Components for latency optimization
-        self.audio_buffer = AudioBuffer(max_size=6)
         self.throttled_checker = ThrottledChecker(min_interval=2.5)
+        # Groq round-trip estimates (EWMA), None until the first response
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.rto_backoff = 1  # Doubled on each Groq timeout, reset by the next response
+        # Groq decisions for the current question, keyed by answer hashes
+        self._completion_cache: OrderedDict = OrderedDict()
+        self.completion_cache_size = 64
+        # In-flight Groq check, cancelled when new speech makes it stale
+        self._check_task: Optional[asyncio.Task] = None
+        self._check_semaphore = asyncio.Semaphore(1)
         self.adaptive_timer = AdaptiveTimer()
         self.health_monitor = ConnectionHealthMonitor()
+        self._last_health_bucket: Optional[int] = None
+        self._cached_health = 1.0  # Last score computed by monitor_connection_health
         self.groq_api_key = os.getenv('GROQ_API_KEY')
         self.deepgram_api_key = os.getenv('DEEPGRAM_API_KEY')
         
         self.transcript_manager = TranscriptManager(session_id)
+        self.tts_prefetch_task: Optional[asyncio.Task] = None
         
         self.reset_for_next_question()
-    
-    def _load_questions(self):
-        """
-        Load questions from JSON file in questions folder.
-        Falls back to default questions if file not found.
-        """
-        try:
-            with open('questions/questions.json', 'r', encoding='utf-8') as f:
-                questions = json.load(f)
-            logger.info(f"Loaded {len(questions)} questions from file")
-            return questions
-        except FileNotFoundError:
-            logger.warning("Questions file not found, using default questions")
-            return [
-                "What is the difference between a list and a tuple in Python?",
-                "Explain how Python's garbage collection works.",
-                "What are decorators in Python and how do you use them?",
-                "How does Python handle memory management?",
-                "What are Python generators and when would you use them?",
-            ]
-        except Exception as e:
-            logger.error(f"Error loading questions: {e}, using default questions")
-            return [
-                "What is the difference between a list and a tuple in Python?",
-                "Explain how Python's garbage collection works.",
-                "What are decorators in Python and how do you use them?",
-            ]
+        weakref.finalize(self, logger.info, "Session %s released", session_id)
     
     async def connect_deepgram(self):
         """
@@ -334,29 +476,17 @@ class InterviewSession:
                 logger.error("DEEPGRAM_API_KEY not found for TTS")
                 return None
             
-            url = "https://api.deepgram.com/v1/speak"
-            headers = {
-                "Authorization": f"Token {self.deepgram_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # JSON structure for Deepgram TTS
-            data = {
-                "text": text
-            }
-            
             logger.info(f"Generating TTS for question: {text[:50]}...")
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.post(url, headers=headers, json=data) as response:
-                    if response.status == 200:
-                        audio_data = await response.read()
-                        logger.info(f"TTS generated successfully: {len(audio_data)} bytes")
-                        return audio_data
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"TTS API error {response.status}: {error_text}")
-                        return None
+            async with self._tts_request(text) as response:
+                if response.status == 200:
+                    audio_data = await response.read()
+                    logger.info(f"TTS generated successfully: {len(audio_data)} bytes")
+                    return audio_data
+                else:
+                    error_text = await response.text()
+                    logger.error(f"TTS API error {response.status}: {error_text}")
+                    return None
                         
         except asyncio.TimeoutError:
             logger.error("TTS generation timeout")
@@ -365,18 +495,97 @@ class InterviewSession:
             logger.error(f"TTS generation error: {e}")
             return None
 
+    def _tts_request(self, text: str):
+        """Build the Deepgram TTS request for text on the shared HTTP client"""
+        url = "https://api.deepgram.com/v1/speak"
+        headers = {
+            "Authorization": f"Token {self.deepgram_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # JSON structure for Deepgram TTS
+        data = {
+            "text": text
+        }
+        
+        return app.state.http.post(url, headers=headers, json=data)
+    
+    async def generate_tts_audio_stream(self, text: str):
+        """
+        Yield TTS audio chunks as they arrive from Deepgram.
+        Serves from the cache when possible and fills it once a stream completes.
+        """
+        audio = TTS_CACHE.get(text)
+        lock = TTS_LOCKS.get(text)
+        if audio is None and lock is not None and lock.locked():
+            # A prefetch for this text is already in flight - reuse it
+            audio = await self.get_tts_audio(text)
+        if audio is not None:
+            yield audio
+            return
+        
+        if not self.deepgram_api_key:
+            logger.error("DEEPGRAM_API_KEY not found for TTS")
+            return
+        
+        chunks = []
+        try:
+            logger.info(f"Streaming TTS for question: {text[:50]}...")
+            
+            async with self._tts_request(text) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"TTS API error {response.status}: {error_text}")
+                    return
+                
+                async for chunk in response.content.iter_chunked(4096):
+                    chunks.append(chunk)
+                    yield chunk
+                TTS_CACHE[text] = b''.join(chunks)
+                
+        except asyncio.TimeoutError:
+            logger.error("TTS streaming timeout")
+            if chunks:
+                # Headers are already sent - abort the response instead of ending a truncated WAV
+                raise
+        except Exception as e:
+            logger.error(f"TTS streaming error: {e}")
+            if chunks:
+                raise
+    
+    async def get_tts_audio(self, text: str):
+        """
+        Return cached TTS audio for text, generating it once on first use.
+        Concurrent callers for the same text share a single Deepgram request.
+        """
+        audio = TTS_CACHE.get(text)
+        if audio is not None:
+            return audio
+        
+        async with TTS_LOCKS.setdefault(text, asyncio.Lock()):
+            audio = TTS_CACHE.get(text)
+            if audio is None:
+                audio = await self.generate_tts_audio(text)
+                if audio:
+                    TTS_CACHE[text] = audio
+            return audio
+    
+    async def prefetch_tts(self):
+        """Warm the TTS cache for every question in the session"""
+        await asyncio.gather(*(self.get_tts_audio(q) for q in self.questions))
+    
     async def start_listening(self):
         """
         Transition from TTS playback to listening mode for user response
         """
         self.is_listening = True
-        self.answer_start_time = time.time()
-        self.last_speech_time = time.time()
+        self.mark_answer_start()
+        self.speech_event.set()
         logger.info("Session now listening for user response")
         
         # Send message to frontend to indicate recording has started
         if self.websocket:
-            await self.websocket.send_json({
+            await send_json_fast(self.websocket, {
                 "type": "recording_started",
                 "message": "Recording started - please speak your answer"
             })
@@ -389,71 +598,67 @@ class InterviewSession:
         if not self.groq_api_key:
             return "wait"
         
-        prompt = f"""You are analyzing a live Python technical interview. Determine if the candidate's answer is COMPLETE and we should move to next question.
-
-QUESTION: {question}
-
-FULL ANSWER (everything said so far): {full_answer}
-
-CURRENT/LATEST TRANSCRIPT (what they just said): {current_transcript}
-
-DECISION CRITERIA:
-- If the FULL ANSWER shows BASIC UNDERSTANDING with at least 1 valid point about the core concept, respond: COMPLETE
-- If the FULL ANSWER is factually correct and relevant (even if brief), respond: COMPLETE
-
-- If CURRENT TRANSCRIPT shows the candidate is clearly MID-SENTENCE or says "um", "uh", "and", "so" indicating they want to continue, respond: WAIT
-- If CURRENT TRANSCRIPT is empty or very short but FULL ANSWER is substantial and complete, respond: COMPLETE
-- If both FULL ANSWER and CURRENT TRANSCRIPT suggest the candidate has finished their thought, respond: COMPLETE
-- Only respond WAIT if the candidate is clearly still speaking or the CURRENT TRANSCRIPT indicates they want to add more
-- Even if the current_transcript and full_answer is irrelevent to the question, respond : WAIT
-
-CONTEXT ANALYSIS:
-- Look at FULL ANSWER to see if the core question has been addressed
-- Look at CURRENT TRANSCRIPT to see if they're still actively speaking
-- Consider if the answer ends naturally or seems cut off
-
-Respond with ONLY one word: either "COMPLETE" or "WAIT" (no explanation)"""
+        # Reuse the previous decision when nothing new has been said
+        cache_key = (self.current_question_index, self.transcript_fingerprint, hash(current_transcript))
+        cached = self._completion_cache.get(cache_key)
+        if cached is not None:
+            self._completion_cache.move_to_end(cache_key)
+            return cached
+        
+        user_content = (
+            f"QUESTION: {question}\n\n"
+            f"FULL ANSWER: {full_answer}\n\n"
+            f"CURRENT TRANSCRIPT: {current_transcript}"
+        )
 
         max_retries = 2
         base_delay = 1.0
         
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=8)) as session:
-                    async with session.post(
-                        'https://api.groq.com/openai/v1/chat/completions',
-                        headers={
-                            'Authorization': f'Bearer {self.groq_api_key}',
-                            'Content-Type': 'application/json'
-                        },
-                        json={
-                            'messages': [{'role': 'user', 'content': prompt}],
-                            'model': 'llama-3.3-70b-versatile',
-                            'max_tokens': 10,
-                            'temperature': 0.1,
-                            'stream': False
-                        }
-                    ) as response:
-                        
-                        if response.status == 429:
-                            wait_time = base_delay * (2 ** attempt)
-                            logger.warning(f"Rate limited, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
-                            continue
-                            
-                        if response.status != 200:
-                            logger.error(f"Groq API error: {response.status}")
-                            return "wait"
-                            
-                        data = await response.json()
+                started = time.monotonic()
+                async with app.state.http.post(
+                    'https://api.groq.com/openai/v1/chat/completions',
+                    headers={
+                        'Authorization': f'Bearer {self.groq_api_key}',
+                        'Content-Type': 'application/json'
+                    },
+                    json={
+                        'messages': [
+                            {'role': 'system', 'content': COMPLETION_SYSTEM_PROMPT},
+                            {'role': 'user', 'content': user_content}
+                        ],
+                        'model': 'llama-3.3-70b-versatile',
+                        'max_tokens': 10,
+                        'temperature': 0.1,
+                        'stream': False
+                    },
+                    timeout=aiohttp.ClientTimeout(total=self.groq_timeout())
+                ) as response:
+                    
+                    if response.status == 429:
+                        wait_time = base_delay * (2 ** attempt)
+                        logger.warning(f"Rate limited, waiting {wait_time}s")
+                        await asyncio.sleep(wait_time)
+                        continue
                         
-                        if data and 'choices' in data and data['choices']:
-                            result = data['choices'][0]['message']['content'].strip().upper()
-                            return "complete" if "COMPLETE" in result else "wait"
+                    if response.status != 200:
+                        logger.error(f"Groq API error: {response.status}")
                         return "wait"
                         
+                    data = await response.json()
+                    self.update_rtt(time.monotonic() - started)
+                    
+                    if data and 'choices' in data and data['choices']:
+                        result = data['choices'][0]['message']['content'].strip().upper()
+                        decision = "complete" if "COMPLETE" in result else "wait"
+                        self._cache_completion(cache_key, decision)
+                        return decision
+                    return "wait"
+                    
             except asyncio.TimeoutError:
-                logger.warning(f"Groq API timeout (attempt {attempt + 1})")
+                self.back_off_rto()
+                logger.warning(f"Groq API timeout (attempt {attempt + 1}), next timeout {self.groq_timeout():.1f}s")
                 if attempt < max_retries - 1:
                     await asyncio.sleep(base_delay * (2 ** attempt))
                 continue
@@ -465,6 +670,141 @@ Respond with ONLY one word: either "COMPLETE" or "WAIT" (no explanation)"""
         
         return "wait"
     
+    async def run_completion_check(self, question: str, full_answer: str, current_transcript: str) -> Optional[str]:
+        """
+        Run the Groq completion check as a cancellable task, one at a time per session.
+        Returns None if the check was cancelled because new speech arrived.
+        """
+        async def limited_check():
+            # Bound Groq requests across all sessions
+            async with app.state.ai_semaphore:
+                return await self.check_completion_async(question, full_answer, current_transcript)
+        
+        async with self._check_semaphore:
+            task = asyncio.create_task(limited_check())
+            self._check_task = task
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            finally:
+                self._check_task = None
+            
+            if task.cancelled():
+                return None
+            return task.result()
+    
+    def cancel_pending_check(self):
+        """Cancel the in-flight Groq check, if any"""
+        if self._check_task and not self._check_task.done():
+            self._check_task.cancel()
+    
+    def _cache_completion(self, key: tuple, decision: str):
+        """Store a Groq decision, evicting the least recently used entry when full"""
+        self._completion_cache[key] = decision
+        self._completion_cache.move_to_end(key)
+        if len(self._completion_cache) > self.completion_cache_size:
+            self._completion_cache.popitem(last=False)
+    
+    def update_rtt(self, rtt: float):
+        """
+        Update smoothed Groq round-trip time and adapt the AI check interval.
+        Uses the TCP-style EWMA estimator: srtt + 4 * rttvar.
+        """
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rto_backoff = 1
+        self.throttled_checker.min_interval = max(0.5, self.srtt + 4 * self.rttvar)
+    
+    def back_off_rto(self):
+        """Double the Groq timeout after a timeout (RFC 6298 section 5.5)"""
+        if self.groq_timeout() < GROQ_TIMEOUT_MAX:
+            self.rto_backoff *= 2
+    
+    def groq_timeout(self) -> float:
+        """Per-request Groq timeout derived from observed round-trip times, with backoff"""
+        if self.srtt is None:
+            rto = GROQ_TIMEOUT_INITIAL
+        else:
+            rto = min(GROQ_TIMEOUT_INITIAL, max(GROQ_TIMEOUT_MIN, self.srtt + 4 * self.rttvar))
+        return min(GROQ_TIMEOUT_MAX, rto * self.rto_backoff)
+    
+    async def wait_for_speech(self, timeout: Optional[float]) -> bool:
+        """
+        Wait until new speech arrives or timeout elapses.
+        Returns True if woken by speech, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self.speech_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.speech_event.clear()
+    
+    def mark_answer_start(self):
+        """Start the answer clock and precompute the no-speech deadline"""
+        self.answer_start_time = time.monotonic()
+        self.no_speech_deadline = self.answer_start_time + self.no_speech_timeout
+        self.mark_speech()
+    
+    def mark_speech(self):
+        """Record speech now and precompute the silence deadlines it resets"""
+        self.last_speech_time = time.monotonic()
+        self.absolute_silence_deadline = self.last_speech_time + self.absolute_silence_limit
+        self.pause_deadline = self.last_speech_time + self.current_pause_duration
+    
+    def next_deadline(self) -> float:
+        """Earliest time at which the auto-check loop has a decision to make"""
+        if not self.has_meaningful_speech:
+            return self.no_speech_deadline
+        return min(self.absolute_silence_deadline, self.pause_deadline)
+    
+    def append_segment(self, segment: str):
+        """Add a final transcript segment to the current answer"""
+        if self.transcript_buffer:
+            self.transcript_committed.write(" ")
+        self.transcript_committed.write(segment)
+        self.transcript_buffer.append(segment)
+        self.transcript_word_count += len(segment.split())
+        self.transcript_dirty = True
+    
+    def _refresh_answer(self):
+        """Materialize and fingerprint the full answer once per new final segment"""
+        if self.transcript_dirty:
+            self._full_answer_cache = self.transcript_committed.getvalue()
+            self._transcript_fingerprint = hash(self._full_answer_cache)
+            self.transcript_dirty = False
+    
+    @property
+    def full_answer(self) -> str:
+        """Full answer so far"""
+        self._refresh_answer()
+        return self._full_answer_cache
+    
+    @property
+    def transcript_fingerprint(self) -> int:
+        """Hash of the full answer - changes whenever a final segment is added"""
+        self._refresh_answer()
+        return self._transcript_fingerprint
+    
+    def queue_transcript_update(self, message: TranscriptMsg):
+        """
+        Queue a transcript update for the client.
+        Final results are always delivered; interim results collapse to the latest one.
+        """
+        if message.is_final:
+            self.pending_interim = None
+            self.out_queue.put_nowait(message)
+        else:
+            self.pending_interim = message
+        self.out_event.set()
+    
     def get_next_question(self):
         """Get the next question from the questions list"""
         if self.current_question_index < len(self.questions):
@@ -476,21 +816,110 @@ Respond with ONLY one word: either "COMPLETE" or "WAIT" (no explanation)"""
     
     def reset_for_next_question(self):
         """Reset state for the next question"""
-        self.transcript_buffer = []
+        self.transcript_buffer = deque()
+        self.transcript_committed = io.StringIO()
+        self.transcript_word_count = 0
+        self.transcript_dirty = False
+        self._full_answer_cache = ""
+        self._transcript_fingerprint = hash("")
         self.live_transcript = ""
-        self.last_speech_time = time.time()
         self.current_pause_duration = self.initial_pause_duration
         self.consecutive_wait_count = 0
-        self.answer_start_time = time.time()
+        self.mark_answer_start()
         self.has_meaningful_speech = False
-        self.last_transcript_length = 0
-        self.last_transcript_check_time = time.time()
-        self.audio_buffer = AudioBuffer(max_size=6)
+        self.last_transcript_fp = hash("")
+        self.last_transcript_check_time = time.monotonic()
+        self._completion_cache.clear()
         self.is_listening = False  # Don't start listening until TTS is done
 
 # Global session storage
 sessions = {}
 
+# Deepgram closes idle streams after ~10s without audio
+DEEPGRAM_KEEPALIVE_INTERVAL = 5.0
+DEEPGRAM_KEEPALIVE_MESSAGE = orjson.dumps({"type": "KeepAlive"}).decode()
+
+# Maximum concurrent Groq completion checks across all sessions
+AI_MAX_INFLIGHT = int(os.getenv("AI_MAX_INFLIGHT", "8"))
+
+# Answers shorter than this skip the Groq check on early pauses; the last
+# pause before a forced move always asks, so short correct answers can complete
+MIN_AI_CHECK_WORDS = int(os.getenv("MIN_AI_CHECK_WORDS", "5"))
+
+# Session eviction settings
+SESSION_IDLE_TIMEOUT = 600.0
+SESSION_REAP_INTERVAL = 60.0
+MAX_SESSIONS = 1000
+
+async def evict_session(session_id: str, reason: str) -> Optional[InterviewSession]:
+    """
+    Remove a session from storage and flush its transcript
+    Returns the evicted session, or None if it was not stored
+    """
+    session = sessions.pop(session_id, None)
+    if session is None:
+        return None
+    logger.info(f"Evicting session {session_id}: {reason}")
+    await session.transcript_manager.finalize()
+    return session
+
+async def reap_idle_sessions():
+    """
+    Background task that evicts sessions with no audio activity
+    for longer than SESSION_IDLE_TIMEOUT
+    """
+    while True:
+        await asyncio.sleep(SESSION_REAP_INTERVAL)
+        try:
+            now = time.monotonic()
+            idle = [
+                session_id for session_id, session in sessions.items()
+                if now - session.health_monitor.last_audio_received > SESSION_IDLE_TIMEOUT
+            ]
+            for session_id in idle:
+                await evict_session(session_id, "idle")
+        except Exception as e:
+            logger.error(f"Session reaper error: {e}")
+
+async def deepgram_keepalive():
+    """
+    Background task that keeps idle Deepgram streams open for all sessions
+    Audio is only relayed while listening, so streams go quiet during TTS playback.
+    Every open stream is also pinged to measure connection latency.
+    """
+    while True:
+        await asyncio.sleep(DEEPGRAM_KEEPALIVE_INTERVAL)
+        for session in list(sessions.values()):
+            ws = session.deepgram_ws
+            if ws is None or ws.closed:
+                continue
+            try:
+                if not session.is_listening:
+                    await ws.send(DEEPGRAM_KEEPALIVE_MESSAGE)
+                session.health_monitor.track_ping(await ws.ping())
+            except Exception as e:
+                logger.debug(f"Deepgram keepalive failed for session {session.session_id}: {e}")
+
+@app.on_event("startup")
+async def startup():
+    """Create the shared HTTP client and start the app-wide background tasks"""
+    app.state.http = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75, ttl_dns_cache=300)
+    )
+    app.state.ai_semaphore = asyncio.Semaphore(AI_MAX_INFLIGHT)
+    app.state.reaper = asyncio.create_task(reap_idle_sessions())
+    app.state.keepalive = asyncio.create_task(deepgram_keepalive())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the background tasks, flush open transcripts and close the shared HTTP client"""
+    app.state.reaper.cancel()
+    app.state.keepalive.cancel()
+    for session_id in list(sessions):
+        await evict_session(session_id, "server shutdown")
+    await app.state.http.close()
+
 @app.get("/")
 async def serve_interview_page(request: Request):
     """Serve the main interview interface"""
@@ -502,10 +931,18 @@ async def start_session():
     Start a new interview session
     Returns session ID and initial configuration
     """
+    # Keep session storage bounded - drop the least recently active session
+    if len(sessions) >= MAX_SESSIONS:
+        oldest_id = min(sessions, key=lambda sid: sessions[sid].health_monitor.last_audio_received)
+        await evict_session(oldest_id, "session limit reached")
+    
     session_id = str(uuid.uuid4())[:8]
     session = InterviewSession(session_id)
     sessions[session_id] = session
     
+    # Generate question audio in the background so playback is instant
+    session.tts_prefetch_task = asyncio.create_task(session.prefetch_tts())
+    
     return {
         "session_id": session_id,
         "total_questions": len(session.questions),
@@ -515,24 +952,23 @@ async def start_session():
 
 @app.get("/api/session/{session_id}/question")
 async def get_question(session_id: str):
-    """Get the next question for a session with TTS audio"""
-    if session_id not in sessions:
+    """
+    Get the next question for a session
+    TTS audio is served separately by /question/audio as raw bytes
+    """
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
     question = session.get_next_question()
     
     if question:
         session.reset_for_next_question()
         
-        # Generate TTS audio for the question
-        tts_audio = await session.generate_tts_audio(question)
-        
         return {
             "question": question,
             "question_number": session.current_question_index,
-            "total_questions": len(session.questions),
-            "tts_audio": tts_audio.hex() if tts_audio else None
+            "total_questions": len(session.questions)
         }
     else:
         return {
@@ -543,28 +979,27 @@ async def get_question(session_id: str):
 @app.get("/api/session/{session_id}/question/audio")
 async def get_question_audio(session_id: str):
     """Stream TTS audio for the current question"""
-    if session_id not in sessions:
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
-    
     if not session.current_question:
         raise HTTPException(status_code=404, detail="No current question")
     
-    logger.info(f"Generating TTS audio for question: {session.current_question}")
-    tts_audio = await session.generate_tts_audio(session.current_question)
+    audio_stream = session.generate_tts_audio_stream(session.current_question)
     
-    if not tts_audio:
+    # Pull the first chunk up front so failures still return an error status
+    try:
+        first_chunk = await audio_stream.__anext__()
+    except StopAsyncIteration:
         raise HTTPException(status_code=500, detail="Failed to generate TTS audio")
     
-    return StreamingResponse(
-        io.BytesIO(tts_audio),
-        media_type="audio/wav",
-        headers={
-            "Content-Length": str(len(tts_audio)),
-            "Content-Type": "audio/wav"
-        }
-    )
+    async def audio_body():
+        yield first_chunk
+        async for chunk in audio_stream:
+            yield chunk
+    
+    return StreamingResponse(audio_body(), media_type="audio/wav")
 
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
@@ -575,23 +1010,24 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket.accept()
     logger.info(f"WebSocket connected for session {session_id}")
     
-    if session_id not in sessions:
-        await websocket.send_json({"error": "Session not found"})
+    session = sessions.get(session_id)
+    if session is None:
+        await send_json_fast(websocket, {"error": "Session not found"})
         await websocket.close()
         return
     
-    session = sessions[session_id]
     session.websocket = websocket  # Store websocket reference
     
     # Connect to Deepgram for speech recognition
     if not await session.connect_deepgram():
-        await websocket.send_json({"error": "Failed to connect to Deepgram"})
+        await send_json_fast(websocket, {"error": "Failed to connect to Deepgram"})
         await websocket.close()
         return
 
     # Start background tasks
     auto_check_task = asyncio.create_task(optimized_auto_check_completion(session, websocket))
     health_task = asyncio.create_task(monitor_connection_health(session, websocket))
+    flush_task = asyncio.create_task(flush_out_loop(session, websocket))
 
     async def receive_from_deepgram():
         """
@@ -602,56 +1038,63 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             logger.info("Starting Deepgram message receiver...")
             while True:
                 try:
-                    message = await asyncio.wait_for(session.deepgram_ws.recv(), timeout=10.0)
+                    # Liveness is covered by websocket pings and the app-wide KeepAlive task
+                    message = await session.deepgram_ws.recv()
                     session.health_monitor.update_audio_received()
-                    data = json.loads(message)
                     
-                    logger.info(f"Deepgram message type: {data.get('type')}")
+                    # Skip frames we never act on without parsing them
+                    if any(marker in message for marker in DEEPGRAM_IGNORED_FRAMES):
+                        continue
+                    if not session.is_listening and DEEPGRAM_RESULTS_FRAME in message:
+                        continue
+                    
+                    data = orjson.loads(message)
+                    message_type = data.get('type')
                     
-                    if data.get('type') == 'Results':
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Deepgram message type: {message_type}")
+                    
+                    if message_type == 'Results':
                         transcript = ""
                         is_final = False
                         
-                        if 'channel' in data and 'alternatives' in data['channel']:
-                            alternatives = data['channel']['alternatives']
-                            if alternatives:
-                                transcript = alternatives[0].get('transcript', '').strip()
-                                is_final = data.get('is_final', False)
+                        alternatives = data.get('channel', {}).get('alternatives')
+                        if alternatives:
+                            transcript = alternatives[0].get('transcript', '').strip()
+                            is_final = data.get('is_final', False)
                         
-                        logger.info(f"Deepgram transcript: '{transcript}' (is_final: {is_final})")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Deepgram transcript: '{transcript}' (is_final: {is_final})")
                         
                         if transcript and session.is_listening:
                             if is_final:
-                                session.transcript_buffer.append(transcript)
+                                session.append_segment(transcript)
+                                session.cancel_pending_check()
                                 session.live_transcript = ""
-                                session.last_speech_time = time.time()
+                                session.mark_speech()
+                                session.speech_event.set()
                                 
                                 if len(transcript.split()) >= 1:
                                     session.has_meaningful_speech = True
-                                    logger.info(f"Meaningful speech detected: '{transcript}'")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"Meaningful speech detected: '{transcript}'")
                             else:
                                 session.live_transcript = transcript
                                 if len(transcript.split()) >= 1:
-                                    session.last_speech_time = time.time()
+                                    session.mark_speech()
                                     session.has_meaningful_speech = True
+                                    session.speech_event.set()
                             
-                            # Send transcript update to client
-                            await websocket.send_json({
-                                "type": "transcript",
-                                "transcript": transcript,
-                                "is_final": is_final,
-                                "full_answer": " ".join(session.transcript_buffer),
-                                "live": session.live_transcript
-                            })
-                    elif data.get('type') == 'error':
+                            # Queue transcript update for the batched sender
+                            session.queue_transcript_update(TranscriptMsg(
+                                transcript=transcript,
+                                is_final=is_final,
+                                live=session.live_transcript,
+                                full_answer=session.full_answer if is_final else None
+                            ))
+                    elif message_type == 'error':
                         logger.error(f"Deepgram error: {data}")
-                    elif data.get('type') == 'Metadata':
-                        # Keep connection alive - no action needed
-                        pass
                         
-                except asyncio.TimeoutError:
-                    # No message from Deepgram, but continue listening
-                    continue
                 except websockets.exceptions.ConnectionClosed:
                     logger.info("Deepgram connection closed")
                     break
@@ -669,30 +1112,36 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             while True:
                 try:
                     # Wait for audio data from client
-                    message = await asyncio.wait_for(websocket.receive(), timeout=1.0)
+                    message = await websocket.receive()
+                    
+                    if message["type"] == "websocket.disconnect":
+                        logger.info("Client WebSocket disconnected")
+                        break
                     
-                    if "bytes" in message:
+                    if message.get("bytes") is not None:
                         audio_data = message["bytes"]
-                        logger.info(f"Received audio data from client: {len(audio_data)} bytes")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Received audio data from client: {len(audio_data)} bytes")
                         
                         # Send to Deepgram if we're in listening mode
                         if session.deepgram_ws and not session.deepgram_ws.closed and session.is_listening:
                             try:
                                 await session.deepgram_ws.send(audio_data)
                                 session.health_monitor.update_audio_received()
-                                logger.info(f"Sent {len(audio_data)} bytes to Deepgram")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"Sent {len(audio_data)} bytes to Deepgram")
                             except websockets.exceptions.ConnectionClosed:
                                 logger.error("Deepgram connection closed during send")
                                 break
                             except Exception as e:
                                 logger.error(f"Error sending to Deepgram: {e}")
                                 break
-                        else:
-                            logger.warning(f"Not sending audio to Deepgram - listening: {session.is_listening}, deepgram_ws: {session.deepgram_ws is not None and not session.deepgram_ws.closed}")
+                        elif logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Not sending audio to Deepgram - listening: {session.is_listening}, deepgram_ws: {session.deepgram_ws is not None and not session.deepgram_ws.closed}")
                                 
-                    elif "text" in message:
+                    elif message.get("text") is not None:
                         # Handle text control messages from client
-                        data = json.loads(message["text"])
+                        data = orjson.loads(message["text"])
                         if data.get("type") == "start_listening":
                             logger.info("Received start_listening message from client")
                             await session.start_listening()
@@ -700,9 +1149,6 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                             logger.info("Received tts_finished message from client")
                             await session.start_listening()
                             
-                except asyncio.TimeoutError:
-                    # No data received, but continue listening
-                    continue
                 except WebSocketDisconnect:
                     logger.info("Client WebSocket disconnected")
                     break
@@ -710,21 +1156,27 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         except Exception as e:
             logger.error(f"Audio streaming error: {e}")
 
+    relay_tasks = [
+        asyncio.create_task(receive_from_deepgram()),
+        asyncio.create_task(send_to_deepgram())
+    ]
     try:
-        # Run both communication tasks concurrently
-        await asyncio.gather(
-            receive_from_deepgram(),
-            send_to_deepgram(),
-            return_exceptions=True
-        )
+        # Run both communication tasks until either side closes
+        await asyncio.wait(relay_tasks, return_when=asyncio.FIRST_COMPLETED)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
         # Cleanup tasks and connections
+        for task in relay_tasks:
+            task.cancel()
         auto_check_task.cancel()
         health_task.cancel()
+        flush_task.cancel()
         if session.deepgram_ws:
             await session.deepgram_ws.close()
+        if await evict_session(session_id, "websocket closed") is None:
+            # Already evicted (e.g. by the idle reaper) - answers recorded since then still need saving
+            await session.transcript_manager.finalize()
         logger.info(f"WebSocket closed for session {session_id}")
 
 async def optimized_auto_check_completion(session: InterviewSession, websocket: WebSocket):
@@ -738,80 +1190,100 @@ async def optimized_auto_check_completion(session: InterviewSession, websocket:
         try:
             if not session.is_listening:
                 logger.debug("Auto-check: Session not listening, waiting...")
-                await asyncio.sleep(0.5)
+                await session.wait_for_speech(None)
                 continue
             
             # Check connection health before proceeding
             health_score = session.health_monitor.get_health_score()
             if health_score < 0.5:
-                logger.warning(f"Poor connection health: {health_score}")
+                logger.warning("Poor connection health: %s", health_score)
                 await asyncio.sleep(1.0)
                 continue
             
-            current_time = time.time()
+            current_time = time.monotonic()
             silence_duration = current_time - session.last_speech_time
-            total_elapsed = current_time - session.answer_start_time
             
-            full_answer = " ".join(session.transcript_buffer)
             current_transcript = session.live_transcript
-            current_transcript_length = len(full_answer)
             
             # Check for meaningful speech (at least 1 word)
-            total_words = len(full_answer.split())
+            total_words = session.transcript_word_count
             has_content = total_words >= 1
             
             # Update meaningful speech flag
             if has_content and not session.has_meaningful_speech:
                 session.has_meaningful_speech = True
-                logger.info(f"Meaningful speech updated: {total_words} words")
+                logger.debug("Meaningful speech updated: %d words", total_words)
             
-            logger.info(f"Auto-check: silence={silence_duration:.1f}s, total={total_elapsed:.1f}s, words={total_words}, listening={session.is_listening}")
+            # Per-tick trace - skip the formatting entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Auto-check: silence=%.1fs, total=%.1fs, words=%d, listening=%s",
+                    silence_duration, current_time - session.answer_start_time,
+                    total_words, session.is_listening
+                )
             
             # CASE 1: No meaningful speech after timeout
             if not session.has_meaningful_speech:
-                if total_elapsed >= session.no_speech_timeout:
-                    logger.info(f"No meaningful answer after {session.no_speech_timeout}s (total words: {total_words})")
+                if current_time >= session.no_speech_deadline:
+                    logger.info("No meaningful answer after %ss (total words: %d)", session.no_speech_timeout, total_words)
                     await move_to_next(session, websocket, "no_answer")
                     continue
-                await asyncio.sleep(0.5)
+                await session.wait_for_speech(max(0.0, session.next_deadline() - time.monotonic()))
                 continue
             
             # Check transcript growth to detect if user is still active
             if current_time - session.last_transcript_check_time >= 2.0:
-                if current_transcript_length > session.last_transcript_length:
-                    logger.info(f"Transcript growing: {session.last_transcript_length} -> {current_transcript_length} chars")
+                fingerprint = session.transcript_fingerprint
+                if fingerprint != session.last_transcript_fp:
+                    logger.debug("Transcript growing: %d words", total_words)
                     session.consecutive_wait_count = 0
-                    session.last_transcript_length = current_transcript_length
+                    session.last_transcript_fp = fingerprint
                 session.last_transcript_check_time = current_time
             
             # CASE 2: Absolute silence limit - user has stopped speaking entirely
-            if silence_duration >= session.absolute_silence_limit:
-                logger.info(f"Absolute silence limit: {session.absolute_silence_limit}s")
+            if current_time >= session.absolute_silence_deadline:
+                logger.info("Absolute silence limit: %ss", session.absolute_silence_limit)
                 await move_to_next(session, websocket, "forced_complete")
                 continue
             
             # CASE 3: Check pause threshold with throttling and AI analysis
-            if silence_duration >= session.current_pause_duration:
-                if not await session.throttled_checker.should_check():
-                    await asyncio.sleep(0.5)
-                    continue
+            if current_time >= session.pause_deadline:
+                answer_words = total_words + len(current_transcript.split())
+                if (answer_words < MIN_AI_CHECK_WORDS
+                        and session.consecutive_wait_count + 1 < session.max_consecutive_waits):
+                    # Likely still starting the answer - skip the model and keep waiting
+                    logger.info("Pause detected: %.1fs - Skipping AI check (words: %d)", silence_duration, answer_words)
+                    decision = "wait"
+                else:
+                    if not await session.throttled_checker.should_check():
+                        # Rate limiting lives in the checker - wake exactly when it allows the next check
+                        await session.wait_for_speech(session.throttled_checker.time_until_next())
+                        continue
+                        
+                    logger.info("Pause detected: %.1fs - Checking with AI (words: %d)", silence_duration, total_words)
                     
-                logger.info(f"Pause detected: {silence_duration:.1f}s - Checking with AI (words: {total_words})")
-                
-                await websocket.send_json({
-                    "type": "checking_completion",
-                    "message": "AI checking answer",
-                    "health_score": health_score
-                })
-                
-                # Use AI to determine if answer is complete
-                decision = await session.check_completion_async(
-                    session.current_question,
-                    full_answer,
-                    current_transcript
-                )
+                    await send_json_fast(websocket, {
+                        "type": "checking_completion",
+                        "message": "AI checking answer",
+                        "health_score": health_score
+                    })
+                    
+                    # Use AI to determine if answer is complete
+                    decision = await session.run_completion_check(
+                        session.current_question,
+                        session.full_answer,
+                        current_transcript
+                    )
                 
-                if decision == "complete":
+                if decision is None:
+                    # New speech arrived mid-check - reassess with the updated answer
+                    logger.info("AI check cancelled by new speech")
+                    await send_json_fast(websocket, {
+                        "type": "wait_continue",
+                        "message": "Continue speaking",
+                        "consecutive_waits": session.consecutive_wait_count
+                    })
+                elif decision == "complete":
                     logger.info("AI: Answer COMPLETE")
                     await move_to_next(session, websocket, "complete")
                 else:
@@ -819,7 +1291,7 @@ async def optimized_auto_check_completion(session: InterviewSession, websocket:
                     session.consecutive_wait_count += 1
                     
                     if session.consecutive_wait_count >= session.max_consecutive_waits:
-                        logger.info(f"Max waits reached: {session.consecutive_wait_count}")
+                        logger.info("Max waits reached: %d", session.consecutive_wait_count)
                         await move_to_next(session, websocket, "forced_complete")
                     else:
                         # Increase pause duration for next check
@@ -827,40 +1299,85 @@ async def optimized_auto_check_completion(session: InterviewSession, websocket:
                             session.current_pause_duration + session.pause_increment,
                             6.0
                         )
-                        session.last_speech_time = time.time()
+                        session.mark_speech()
                         
-                        await websocket.send_json({
+                        await send_json_fast(websocket, {
                             "type": "wait_continue",
                             "message": "Continue speaking",
                             "consecutive_waits": session.consecutive_wait_count
                         })
             
-            await asyncio.sleep(0.3)
+            # Sleep until new speech or the next silence deadline, whichever is first
+            if session.is_listening:
+                await session.wait_for_speech(max(0.0, session.next_deadline() - time.monotonic()))
             
         except Exception as e:
-            logger.error(f"Auto-check error: {e}")
+            logger.error("Auto-check error: %s", e)
             await asyncio.sleep(1.0)
 
+async def flush_out_loop(session: InterviewSession, websocket: WebSocket):
+    """
+    Background task that coalesces transcript updates into batched sends
+    Final results are flushed immediately, interim results at most every 80ms
+    Sleeps without a timeout until the first update arrives
+    """
+    while True:
+        try:
+            await session.out_event.wait()
+            
+            batch = []
+            if session.out_queue.empty():
+                # Only an interim so far - hold it for up to 80ms unless a final result arrives
+                try:
+                    batch.append(await asyncio.wait_for(session.out_queue.get(), timeout=0.08))
+                except asyncio.TimeoutError:
+                    pass
+            session.out_event.clear()
+            
+            # Drain everything else that is already queued
+            while not session.out_queue.empty():
+                batch.append(session.out_queue.get_nowait())
+            
+            if session.pending_interim is not None:
+                batch.append(session.pending_interim)
+                session.pending_interim = None
+            
+            if batch:
+                await websocket.send_bytes(session.msg_encoder.encode(batch))
+                
+        except Exception as e:
+            logger.error(f"Transcript flush error: {e}")
+            await asyncio.sleep(1.0)
+
+# Network latency per health bucket (poor, degraded, good) and re-check intervals
+HEALTH_BUCKET_LATENCIES = (0.5, 0.2, 0.1)
+HEALTH_IDLE_INTERVAL = 15
+HEALTH_CHANGE_INTERVAL = 5
+
 async def monitor_connection_health(session: InterviewSession, websocket: WebSocket):
     """
     Background task to monitor connection health and adjust parameters
-    Sends periodic health updates to the client
+    Sends a health update to the client only when the health bucket changes
     """
     while True:
         try:
             health_score = session.health_monitor.get_health_score()
+            session._cached_health = health_score
+            bucket = 0 if health_score < 0.3 else 1 if health_score < 0.7 else 2
             
-            # Adjust network latency based on health
-            if health_score < 0.3:
-                session.adaptive_timer.network_latency = 0.5
-            elif health_score < 0.7:
-                session.adaptive_timer.network_latency = 0.2
-            else:
-                session.adaptive_timer.network_latency = 0.1
+            # Use the measured Deepgram ping latency, falling back to the health bucket estimate
+            measured = session.health_monitor.average_latency()
+            session.adaptive_timer.network_latency = (
+                measured if measured is not None else HEALTH_BUCKET_LATENCIES[bucket]
+            )
+            
+            if bucket == session._last_health_bucket:
+                await asyncio.sleep(HEALTH_IDLE_INTERVAL)
+                continue
+            session._last_health_bucket = bucket
             
-            # Send health update to client periodically
             try:
-                await websocket.send_json({
+                await send_json_fast(websocket, {
                     "type": "health_update",
                     "health_score": health_score,
                     "network_latency": session.adaptive_timer.network_latency
@@ -868,7 +1385,7 @@ async def monitor_connection_health(session: InterviewSession, websocket: WebSoc
             except Exception as e:
                 logger.debug(f"Could not send health update: {e}")
             
-            await asyncio.sleep(5)
+            await asyncio.sleep(HEALTH_CHANGE_INTERVAL)
             
         except Exception as e:
             logger.error(f"Health monitoring error: {e}")
@@ -880,128 +1397,155 @@ async def move_to_next(session: InterviewSession, websocket: WebSocket, reason:
     Saves current transcript and notifies client
     """
     # Save transcript with answer segments
-    session.transcript_manager.add_transcript(
+    await session.transcript_manager.add_transcript(
         session.current_question,
-        session.transcript_buffer,
+        list(session.transcript_buffer),
         session.current_question_index
     )
     
     session.is_listening = False
     
-    await websocket.send_json({
+    await send_json_fast(websocket, {
         "type": "move_to_next",
         "reason": reason,
         "message": "Moving to next question"
     })
 
 @app.get("/api/session/{session_id}/transcripts")
-async def get_transcripts(session_id: str):
-    """Get all transcripts for a session"""
-    if session_id not in sessions:
+async def get_transcripts(session_id: str, since: int = 0):
+    """
+    Get transcripts for a session, starting at index `since`
+    Pass the returned `next` as `since` on the following poll to fetch only new answers
+    """
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
+    transcripts = session.transcript_manager.transcripts
     return {
-        "transcripts": session.transcript_manager.transcripts,
+        "transcripts": transcripts[max(since, 0):],
+        "next": len(transcripts),
         "file": session.transcript_manager.transcript_filename
     }
 
 @app.get("/api/session/{session_id}/health")
 async def get_health(session_id: str):
     """Get health status of a session"""
-    if session_id not in sessions:
+    session = sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
     return {
         "health_score": session.health_monitor.get_health_score(),
-        "network_latency": session.adaptive_timer.network_latency,
-        "audio_buffer_size": len(session.audio_buffer.buffer)
+        "network_latency": session.adaptive_timer.network_latency
     }
 
 @app.get("/api/debug/deepgram-test")
 async def deepgram_test():
     """Test Deepgram TTS API connectivity and configuration"""
-    import aiohttp
-    
     try:
         api_key = os.getenv('DEEPGRAM_API_KEY')
         if not api_key:
             return {"error": "DEEPGRAM_API_KEY not found"}
         
         # Test TTS API with simple text
-        async with aiohttp.ClientSession() as session:
-            url = "https://api.deepgram.com/v1/speak"
-            headers = {
-                "Authorization": f"Token {api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Test with different payload formats
-            test_payloads = [
-                {"text": "Hello, this is a test of the Deepgram TTS system."},
-                {"text": "Test message for TTS", "model": "aura-asteria-en"}
-            ]
-            
-            results = []
-            for i, payload in enumerate(test_payloads):
-                try:
-                    async with session.post(url, headers=headers, json=payload) as response:
-                        if response.status == 200:
-                            audio_data = await response.read()
-                            results.append({
-                                "payload": i+1,
-                                "status": "success", 
-                                "audio_size": len(audio_data)
-                            })
-                        else:
-                            error_text = await response.text()
-                            results.append({
-                                "payload": i+1,
-                                "status": "failed",
-                                "error": f"Status {response.status}",
-                                "details": error_text
-                            })
-                except Exception as e:
-                    results.append({
-                        "payload": i+1,
-                        "status": "error",
-                        "error": str(e)
-                    })
-            
-            return {
-                "tts_test_results": results,
-                "message": "Check which payload format works with your Deepgram account"
-            }
+        url = "https://api.deepgram.com/v1/speak"
+        headers = {
+            "Authorization": f"Token {api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Test with different payload formats
+        test_payloads = [
+            {"text": "Hello, this is a test of the Deepgram TTS system."},
+            {"text": "Test message for TTS", "model": "aura-asteria-en"}
+        ]
+        
+        async def post_one(payload: dict, i: int):
+            try:
+                async with app.state.http.post(url, headers=headers, json=payload) as response:
+                    if response.status == 200:
+                        # Only the size is reported, so count chunks instead of buffering the audio
+                        audio_size = 0
+                        async for chunk in response.content.iter_chunked(65536):
+                            audio_size += len(chunk)
+                        return {
+                            "payload": i+1,
+                            "status": "success", 
+                            "audio_size": audio_size
+                        }
+                    else:
+                        error_text = await response.text()
+                        return {
+                            "payload": i+1,
+                            "status": "failed",
+                            "error": f"Status {response.status}",
+                            "details": error_text
+                        }
+            except Exception as e:
+                return {
+                    "payload": i+1,
+                    "status": "error",
+                    "error": str(e)
+                }
+        
+        # Run both test requests concurrently on the shared HTTP client
+        results = await asyncio.gather(*(post_one(payload, i) for i, payload in enumerate(test_payloads)))
+        
+        return {
+            "tts_test_results": list(results),
+            "message": "Check which payload format works with your Deepgram account"
+        }
                     
     except Exception as e:
         return {"error": f"Test failed: {str(e)}"}
     
 @app.get("/api/debug/connections")
 async def debug_connections():
-    """Debug endpoint to check all active connections and their states"""
-    connection_info = []
-    for session_id, session in sessions.items():
-        connection_info.append({
+    """
+    Debug endpoint to check all active connections and their states
+    Reads the health score cached by each session's health monitor
+    """
+    connection_info = [
+        {
             "session_id": session_id,
             "deepgram_connected": session.deepgram_ws is not None and not session.deepgram_ws.closed,
             "is_listening": session.is_listening,
-            "health_score": session.health_monitor.get_health_score(),
-            "audio_buffer_size": len(session.audio_buffer.buffer),
+            "health_score": session._cached_health,
             "network_latency": session.adaptive_timer.network_latency,
             "transcript_length": len(session.transcript_buffer),
             "current_question": session.current_question
-        })
-    return {"active_connections": connection_info}
+        }
+        for session_id, session in sessions.items()
+    ]
+    return {
+        "active_connections": connection_info,
+        "ai_checks": {
+            "max_inflight": AI_MAX_INFLIGHT,
+            "available": app.state.ai_semaphore._value
+        }
+    }
 
 @app.delete("/api/session/{session_id}")
 async def end_session(session_id: str):
     """End a specific interview session"""
-    if session_id in sessions:
-        del sessions[session_id]
-        return {"message": "Session ended"}
-    raise HTTPException(status_code=404, detail="Session not found")
+    if await evict_session(session_id, "ended by client") is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return {"message": "Session ended"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    # Sessions live in this process's memory, so more than one worker
+    # needs sticky routing per session (or keep WORKERS=1)
+    workers = int(os.getenv("WORKERS", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="auto",  # uvloop when installed (not available on Windows)
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False,
+        workers=workers
+    )
\ No newline at end of file
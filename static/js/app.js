@@ -23,6 +23,9 @@ let latencyHistory = [];
 let isPlayingQuestion = false;
 let isRecording = false;
 
+// Server messages arrive as UTF-8 JSON in binary frames
+const textDecoder = new TextDecoder();
+
 // DOM Elements cache
 const elements = {
     // Buttons and controls
@@ -262,6 +265,7 @@ function connectWebSocket() {
     console.log(`Connecting to WebSocket for session: ${sessionId}`);
     
     ws = new WebSocket(`${API_URL.replace('http', 'ws')}/ws/${sessionId}`);
+    ws.binaryType = 'arraybuffer';
     
     ws.onopen = async () => {
         console.log('WebSocket connected successfully');
@@ -275,9 +279,16 @@ function connectWebSocket() {
     
     ws.onmessage = (event) => {
         try {
-            const data = JSON.parse(event.data);
+            const text = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+            const data = JSON.parse(text);
             console.log('WebSocket message received:', data);
-            handleWebSocketMessage(data);
+            
+            // Transcript updates arrive batched as an array of compact messages
+            if (Array.isArray(data)) {
+                data.forEach(msg => handleWebSocketMessage(Array.isArray(msg) ? decodeCompactMessage(msg) : msg));
+            } else {
+                handleWebSocketMessage(data);
+            }
         } catch (error) {
             console.error('Error parsing WebSocket message:', error);
         }
@@ -297,6 +308,16 @@ function connectWebSocket() {
     };
 }
 
+/**
+ * Expand a positional transcript message into an object
+ * @param {Array} msg - ["transcript", transcript, is_final, live, full_answer]
+ * @returns {Object} Message object with named fields
+ */
+function decodeCompactMessage(msg) {
+    const [type, transcript, is_final, live, full_answer] = msg;
+    return { type, transcript, is_final, live, full_answer };
+}
+
 /**
  * Handle incoming WebSocket messages from the server
  * @param {Object} data - Parsed WebSocket message data
@@ -346,9 +367,11 @@ function handleTranscriptUpdate(data) {
         elements.liveTranscript.textContent = data.live || 'Listening...';
     }
     
-    // Update word count
-    const wordCount = data.full_answer ? data.full_answer.split(' ').filter(w => w).length : 0;
-    elements.wordCount.textContent = `Words: ${wordCount}`;
+    // Update word count - full answer is only sent with final results
+    if (typeof data.full_answer === 'string') {
+        const wordCount = data.full_answer.split(' ').filter(w => w).length;
+        elements.wordCount.textContent = `Words: ${wordCount}`;
+    }
 }
 
 /**
@@ -464,37 +487,33 @@ async function playQuestionAudio() {
         
         isPlayingQuestion = true;
         
-        // Fetch TTS audio from server
-        const response = await fetch(`${API_URL}/api/session/${sessionId}/question/audio`);
-        
-        if (!response.ok) {
-            throw new Error(`Failed to get TTS audio: ${response.status}`);
-        }
-        
-        const audioBlob = await response.blob();
-        
-        if (audioBlob.size === 0) {
-            throw new Error('Empty audio blob received');
-        }
+        // Stream TTS audio from server - playback starts before the download completes
+        const audio = new Audio(`${API_URL}/api/session/${sessionId}/question/audio`);
         
-        const audioUrl = URL.createObjectURL(audioBlob);
-        const audio = new Audio(audioUrl);
+        // A failed request fires onerror and rejects play() - only handle the first outcome
+        let settled = false;
+        const settle = () => {
+            if (settled) return false;
+            settled = true;
+            return true;
+        };
         
         // Set up audio event handlers
         audio.onended = async () => {
+            if (!settle()) return;
             console.log('TTS audio playback completed');
             await handleTTSCompleted();
         };
         
         audio.onerror = (error) => {
             console.error('Audio playback error:', error);
-            handleTTSError('Audio playback failed');
+            if (settle()) handleTTSError('Audio playback failed');
         };
         
         // Start audio playback
         await audio.play().catch(error => {
             console.error('Audio play failed:', error);
-            handleTTSError('Audio play failed');
+            if (settle()) handleTTSError('Audio play failed');
         });
         
     } catch (error) {